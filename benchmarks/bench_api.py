@@ -0,0 +1,89 @@
+"""Compara a listagem em HTML com a API JSON (/api/animais).
+
+Popula um SQLite temporário com anúncios e mede, para a mesma página, o tempo
+e o tamanho de /listar_animais, de /api/animais sem compressão, com gzip (e
+brotli, se instalado) e de uma nova consulta com If-None-Match (304).
+
+Uso:
+    python benchmarks/bench_api.py --animais 5000 --por-pagina 50
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+_arquivo_db = os.path.join(tempfile.mkdtemp(prefix='adoteja-api-'), 'api.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{_arquivo_db}'
+
+from sqlalchemy import insert  # noqa: E402
+from werkzeug.security import generate_password_hash  # noqa: E402
+
+import app as adoteja  # noqa: E402
+from app import app, db, Animal, Usuario  # noqa: E402
+
+
+def popular(qtd):
+    agora = adoteja.agora_sp()
+    db.session.add(Usuario(nome='Doador', email='doador@exemplo.com', senha=generate_password_hash('senha'),
+                           telefone='(43) 99999-0000', estado='PR', cidade='Londrina', email_confirmado=True))
+    db.session.flush()
+    db.session.execute(insert(Animal), [
+        {'usuario_id': 1, 'nome': f'Pet {i}', 'especie': 'Cachorro', 'raca': 'SRD Porte Médio', 'sexo': 'Macho',
+         'estado': 'PR', 'cidade': 'Londrina', 'foto': f'{i:064x}', 'criado_em': agora - adoteja.timedelta(minutes=i),
+         'atualizado_em': agora, 'ativo': True, 'data_validade': agora + adoteja.timedelta(days=30)}
+        for i in range(qtd)
+    ])
+    db.session.commit()
+
+
+def medir(cliente, url, repeticoes, **cabecalhos):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resposta = cliente.get(url, headers=cabecalhos)
+        tempos.append(time.perf_counter() - inicio)
+    tempos.sort()
+    return resposta, tempos[len(tempos) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--animais', type=int, default=5000)
+    parser.add_argument('--por-pagina', type=int, default=50)
+    parser.add_argument('--repeticoes', type=int, default=20)
+    args = parser.parse_args()
+
+    app.config['ANIMAIS_POR_PAGINA_MAX'] = max(args.por_pagina, app.config['ANIMAIS_POR_PAGINA_MAX'])
+    with app.app_context():
+        db.create_all()
+        popular(args.animais)
+
+    cliente = app.test_client()
+    cliente.post('/login', data={'email': 'doador@exemplo.com', 'senha': 'senha'})
+    sufixo = f'?por_pagina={args.por_pagina}'
+    casos = [('HTML /listar_animais', '/listar_animais' + sufixo, {}),
+             ('JSON sem compressão', '/api/animais' + sufixo, {}),
+             ('JSON gzip', '/api/animais' + sufixo, {'Accept-Encoding': 'gzip'})]
+    if adoteja.brotli is not None:
+        casos.append(('JSON brotli', '/api/animais' + sufixo, {'Accept-Encoding': 'br'}))
+
+    etag = None
+    for nome, url, cabecalhos in casos:
+        resposta, mediana = medir(cliente, url, args.repeticoes, **cabecalhos)
+        assert resposta.status_code == 200, resposta.status_code
+        etag = resposta.headers.get('ETag') or etag
+        print(f"{nome:<24} {mediana:8.2f} ms {len(resposta.data):>9} bytes")
+
+    resposta, mediana = medir(cliente, '/api/animais' + sufixo, args.repeticoes,
+                              **{'Accept-Encoding': 'gzip', 'If-None-Match': etag})
+    assert resposta.status_code == 304, resposta.status_code
+    print(f"{'JSON If-None-Match (304)':<24} {mediana:8.2f} ms {len(resposta.data):>9} bytes")
+
+
+if __name__ == '__main__':
+    main()
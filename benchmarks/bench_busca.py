@@ -0,0 +1,103 @@
+"""Benchmark da busca textual (parâmetro q da listagem).
+
+Popula um SQLite temporário (ou o banco de DATABASE_URL) com anúncios
+sintéticos, monta o índice invertido com reindexar_busca e mede o tempo da
+primeira página de resultados para buscas seletivas, comuns, por prefixo e
+com erro de digitação.
+
+Uso:
+    python benchmarks/bench_busca.py --animais 300000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+if 'DATABASE_URL' not in os.environ:
+    _arquivo_db = os.path.join(tempfile.mkdtemp(prefix='adoteja-busca-'), 'busca.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{_arquivo_db}'
+
+from sqlalchemy import insert  # noqa: E402
+
+import app as adoteja  # noqa: E402
+from app import app, db, Animal, Usuario  # noqa: E402
+
+NOMES = ['Rex', 'Mia', 'Thor', 'Luna', 'Bob', 'Mel', 'Nina', 'Fred', 'Pipoca', 'Bidu', 'Amora', 'Paçoca',
+         'Simba', 'Zeca', 'Jade', 'Tobias', 'Belinha', 'Costelinha', 'Pretinha', 'Farofa']
+RACAS = {
+    'Cachorro': ['Vira-lata', 'Poodle', 'Pug', 'Beagle', 'Shih Tzu', 'Golden Retriever', 'Pastor Alemão'],
+    'Gato': ['SRD', 'Persa', 'Siamês', 'Maine Coon', 'Angorá'],
+}
+BUSCAS = ['pacoca', 'costelinha são', 'golden', 'cachorro', 'vira-lata sao paulo', 'pas', 'siames', 'poodel',
+          'retriver', 'xyzw']
+
+
+def popular(qtd):
+    geo = adoteja.catalogo_geo()
+    aleatorio = random.Random(42)
+    agora = adoteja.agora_sp()
+    db.session.execute(insert(Usuario), [{'nome': 'Doador', 'email': 'doador@exemplo.com', 'senha': 'x'}])
+    lote = []
+    for i in range(qtd):
+        especie = aleatorio.choice(list(RACAS))
+        uf = aleatorio.choice(list(geo.cidades_por_estado))
+        lote.append({
+            'usuario_id': 1,
+            'nome': f"{aleatorio.choice(NOMES)} {i}",
+            'especie': especie,
+            'raca': aleatorio.choice(RACAS[especie]),
+            'sexo': 'Macho',
+            'estado': uf,
+            'cidade': aleatorio.choice(geo.cidades_por_estado[uf]),
+            'criado_em': agora - timedelta(minutes=i),
+            'data_validade': agora + timedelta(days=30),
+            'ativo': True,
+        })
+        if len(lote) >= 5000:
+            db.session.execute(insert(Animal), lote)
+            lote = []
+    if lote:
+        db.session.execute(insert(Animal), lote)
+    db.session.commit()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--animais', type=int, default=200000)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        if not Animal.query.first():
+            popular(args.animais)
+        inicio = time.perf_counter()
+        total = adoteja.reindexar_busca()
+        print(f"Índice: {total} anúncios, {adoteja.TermoAnimal.query.count()} termos "
+              f"em {time.perf_counter() - inicio:.1f}s")
+
+        por_pagina = app.config['ANIMAIS_POR_PAGINA']
+        for q in BUSCAS:
+            tempos = []
+            for _ in range(args.repeticoes):
+                inicio = time.perf_counter()
+                busca = adoteja.consulta_busca(q)
+                query = Animal.query.filter(Animal.ativo == True)
+                resultados = adoteja.paginar_por_relevancia(query, busca, None, por_pagina + 1)
+                tempos.append(time.perf_counter() - inicio)
+                db.session.rollback()
+            tempos.sort()
+            primeiro = resultados[0][0].nome if resultados else '-'
+            print(f"{q!r:>24}: mediana {tempos[len(tempos) // 2] * 1000:8.1f} ms, "
+                  f"{len(resultados):>2} na página, 1º: {primeiro}")
+
+
+if __name__ == '__main__':
+    main()
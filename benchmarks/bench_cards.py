@@ -0,0 +1,90 @@
+"""Mede o cache de cards na listagem e em Meus Anúncios.
+
+Popula um SQLite temporário com anúncios e mede o tempo por requisição com o
+cache desligado (LRU de tamanho zero), na primeira visita (cards renderizados
+e guardados) e nas seguintes (cards vindos do cache), para alguns tamanhos
+de página.
+
+Uso:
+    python benchmarks/bench_cards.py --paginas 20 100
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+_arquivo_db = os.path.join(tempfile.mkdtemp(prefix='adoteja-cards-'), 'cards.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{_arquivo_db}'
+
+from sqlalchemy import insert  # noqa: E402
+from werkzeug.security import generate_password_hash  # noqa: E402
+
+import app as adoteja  # noqa: E402
+from app import app, db, Animal, Usuario  # noqa: E402
+
+
+def popular(qtd):
+    agora = adoteja.agora_sp()
+    senha = generate_password_hash('senha')
+    db.session.execute(insert(Usuario), [
+        {'nome': f'Doador {i}', 'email': f'doador{i}@exemplo.com', 'senha': senha, 'telefone': '(43) 99999-0000',
+         'estado': 'PR', 'cidade': 'Londrina', 'email_confirmado': True, 'atualizado_em': agora}
+        for i in range(20)
+    ])
+    db.session.execute(insert(Animal), [
+        {'usuario_id': 1 + i % 20, 'nome': f'Pet {i}', 'especie': 'Cachorro', 'raca': 'SRD Porte Médio',
+         'sexo': 'Macho', 'estado': 'PR', 'cidade': 'Londrina', 'foto': f'{i:064x}',
+         'criado_em': agora - adoteja.timedelta(minutes=i), 'atualizado_em': agora, 'ativo': True,
+         'data_validade': agora + adoteja.timedelta(days=30)}
+        for i in range(qtd)
+    ])
+    db.session.commit()
+
+
+def medir(cliente, url, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resposta = cliente.get(url)
+        tempos.append(time.perf_counter() - inicio)
+        assert resposta.status_code == 200, resposta.status_code
+    tempos.sort()
+    return tempos[len(tempos) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--paginas', type=int, nargs='+', default=[20, 100])
+    parser.add_argument('--repeticoes', type=int, default=20)
+    args = parser.parse_args()
+
+    app.config['ANIMAIS_POR_PAGINA_MAX'] = max(args.paginas)
+    with app.app_context():
+        db.create_all()
+        popular(max(args.paginas) * 20)
+
+    cliente = app.test_client()
+    cliente.post('/login', data={'email': 'doador0@exemplo.com', 'senha': 'senha'})
+    urls = [f'/listar_animais?por_pagina={n}' for n in args.paginas] + ['/meus_anuncios']
+    for url in urls:
+        cliente.get(url)  # aquece templates e o usuário logado
+
+    cache = adoteja.cache_cards
+    for url in urls:
+        cache.local = adoteja.CacheTTL(0, cache.local.ttl)
+        sem_cache = medir(cliente, url, args.repeticoes)
+        cache.local = adoteja.CacheTTL(app.config['CARDS_CACHE_MAX'], cache.local.ttl)
+        primeira = medir(cliente, url, 1)
+        seguintes = medir(cliente, url, args.repeticoes)
+        print(f"{url:<34} sem cache {sem_cache:7.1f} ms   1ª visita {primeira:7.1f} ms   "
+              f"com cache {seguintes:7.1f} ms")
+    print(cache.estatisticas())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,271 @@
+"""Teste de carga das rotas principais, com várias threads chamando o app WSGI.
+
+Popula o banco (SQLite temporário, ou DATABASE_URL) com `flask popular-banco`
+e roda, durante --duracao segundos, uma mistura de requisições reais: login,
+listagem com combinações de filtros (e a página seguinte pelo cursor), Meus
+Anúncios, cadastro de anúncio com upload de foto e check_email. Mostra a vazão
+e p50/p95/p99 por rota e grava tudo em JSON para comparar entre commits.
+Não usa rede: o cliente de teste do Flask chama o app direto.
+
+Uso:
+    python benchmarks/bench_carga.py --usuarios 1000 --animais 50000 --threads 8 --duracao 30
+    python benchmarks/bench_carga.py --comparar benchmarks/resultados/carga-<commit>-<data>.json
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+
+# Uploads e fotos geradas vão para uma pasta temporária (o app usa caminhos relativos)
+ORIGEM = os.getcwd()
+_pasta = tempfile.mkdtemp(prefix='adoteja-carga-')
+os.chdir(_pasta)
+if 'DATABASE_URL' not in os.environ:
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_pasta, 'carga.db')}"
+os.environ.setdefault('EMAIL_EM_PROCESSO', '0')
+
+# Peso de cada rota na mistura
+MISTURA = {
+    'listar_animais': 50,
+    'listar_animais_pagina_2': 8,
+    'meus_anuncios': 12,
+    'check_email': 15,
+    'cadastrar_animal': 10,
+    'login': 5,
+}
+
+
+def percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p))] if valores else 0.0
+
+
+def commit_atual():
+    try:
+        commit = subprocess.run(['git', '-C', RAIZ, 'rev-parse', '--short', 'HEAD'],
+                                capture_output=True, text=True, check=True).stdout.strip()
+        alterado = subprocess.run(['git', '-C', RAIZ, 'status', '--porcelain', '--untracked-files=no'],
+                                  capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'desconhecido'
+    return f'{commit}-alterado' if alterado else commit
+
+
+def foto_jpeg(aleatorio):
+    """JPEG pequeno e diferente a cada chamada (mesmo conteúdo não seria reprocessado)."""
+    from PIL import Image
+    imagem = Image.new('RGB', (800, 600), tuple(aleatorio.randrange(256) for _ in range(3)))
+    imagem.putpixel((aleatorio.randrange(800), aleatorio.randrange(600)), (0, 0, 0))
+    saida = io.BytesIO()
+    imagem.save(saida, 'JPEG', quality=85)
+    return saida.getvalue()
+
+
+class Usuario:
+    """Um navegador: cliente de teste com sessão própria."""
+
+    def __init__(self, app, adoteja, aleatorio, usuarios, senha):
+        self.app, self.adoteja, self.aleatorio = app, adoteja, aleatorio
+        self.usuarios, self.senha = usuarios, senha
+        self.cliente = app.test_client()
+        self.cidades = [(uf, c) for uf, nomes in adoteja.catalogo_geo().cidades_por_estado.items() for c in nomes]
+
+    def email_sorteado(self):
+        return f'usuario{self.aleatorio.randint(*self.usuarios)}@exemplo.com'
+
+    def login(self):
+        return self.cliente.post('/login', data={'email': self.email_sorteado(), 'senha': self.senha})
+
+    def filtros(self):
+        """Uma das combinações de filtros usadas na listagem."""
+        a = self.aleatorio
+        especie = a.choice(('Cachorro', 'Gato'))
+        estado, cidade = a.choice(self.cidades)
+        return a.choice((
+            {},
+            {'especie': especie},
+            {'especie': especie, 'raca': a.choice(self.adoteja.RACAS_POR_ESPECIE[especie])},
+            {'estado': estado},
+            {'estado': estado, 'cidade': cidade},
+            {'especie': especie, 'sexo': a.choice(('Macho', 'Fêmea')), 'vacinado': '1'},
+            {'q': a.choice(self.adoteja.NOMES_PETS)},
+            {'q': f"{a.choice(self.adoteja.RACAS_POR_ESPECIE[especie])} {especie}".lower()},
+        ))
+
+    def listar_animais(self):
+        return self.cliente.get('/listar_animais', query_string=self.filtros())
+
+    def listar_animais_pagina_2(self):
+        """Devolve None se a primeira página não tiver próxima (nada a medir)."""
+        primeira = self.cliente.get('/listar_animais', query_string=self.filtros())
+        achado = re.search(rb'href="([^"]*[?&]cursor=[^"]+)"', primeira.data)
+        if not achado:
+            return None
+        url = achado.group(1).decode().replace('&amp;', '&')
+        inicio = time.perf_counter()
+        resposta = self.cliente.get(url)
+        return resposta, time.perf_counter() - inicio
+
+    def meus_anuncios(self):
+        return self.cliente.get('/meus_anuncios')
+
+    def check_email(self):
+        email = self.email_sorteado() if self.aleatorio.random() < 0.5 else f'novo{self.aleatorio.random()}@exemplo.com'
+        return self.cliente.post('/check_email', json={'email': email})
+
+    def cadastrar_animal(self):
+        a = self.aleatorio
+        especie = a.choice(('Cachorro', 'Gato'))
+        estado, cidade = a.choice(self.cidades)
+        dados = {
+            'nome': a.choice(self.adoteja.NOMES_PETS), 'especie': especie,
+            'raca': a.choice(self.adoteja.RACAS_POR_ESPECIE[especie]), 'sexo': a.choice(('Macho', 'Fêmea')),
+            'vacinado': str(a.randint(0, 2)), 'castrado': str(a.randint(0, 2)), 'estado': estado, 'cidade': cidade,
+            'foto': (io.BytesIO(foto_jpeg(a)), 'foto.jpg'),
+        }
+        return self.cliente.post('/animal', data=dados, content_type='multipart/form-data')
+
+
+def rodar(app, adoteja, args, usuarios):
+    amostras = defaultdict(list)  # rota -> [segundos]
+    erros = defaultdict(int)
+    lock = threading.Lock()
+    rotas, pesos = zip(*MISTURA.items())
+
+    def navegar(numero):
+        aleatorio = random.Random(args.semente + numero)
+        usuario = Usuario(app, adoteja, aleatorio, usuarios, args.senha)
+        usuario.login()
+        fim = time.monotonic() + args.duracao
+        while time.monotonic() < fim:
+            rota = aleatorio.choices(rotas, pesos)[0]
+            inicio = time.perf_counter()
+            try:
+                resultado = getattr(usuario, rota)()
+            except Exception as erro:  # noqa: BLE001 - conta a falha e segue a carga
+                resultado = erro
+            duracao = time.perf_counter() - inicio
+            if resultado is None:
+                continue
+            if isinstance(resultado, tuple):
+                resultado, duracao = resultado
+            falhou = isinstance(resultado, Exception) or resultado.status_code >= 400
+            with lock:
+                amostras[rota].append(duracao)
+                erros[rota] += falhou
+
+    threads = [threading.Thread(target=navegar, args=(i,)) for i in range(args.threads)]
+    inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return amostras, erros, time.perf_counter() - inicio
+
+
+def resumo(amostras, erros, duracao):
+    rotas = {}
+    for rota in MISTURA:
+        tempos = amostras.get(rota, [])
+        rotas[rota] = {
+            'requisicoes': len(tempos), 'erros': erros.get(rota, 0), 'rps': round(len(tempos) / duracao, 2),
+            'p50_ms': round(percentil(tempos, 0.50) * 1000, 2), 'p95_ms': round(percentil(tempos, 0.95) * 1000, 2),
+            'p99_ms': round(percentil(tempos, 0.99) * 1000, 2),
+        }
+    total = sum(len(t) for t in amostras.values())
+    todos = [d for t in amostras.values() for d in t]
+    return rotas, {'requisicoes': total, 'erros': sum(erros.values()), 'rps': round(total / duracao, 2),
+                   'p50_ms': round(percentil(todos, 0.50) * 1000, 2), 'p95_ms': round(percentil(todos, 0.95) * 1000, 2),
+                   'p99_ms': round(percentil(todos, 0.99) * 1000, 2)}
+
+
+def imprimir(resultado, anterior=None):
+    def variacao(rota, campo):
+        if not anterior:
+            return ''
+        antes = (anterior['total'] if rota == 'total' else anterior['rotas'].get(rota, {})).get(campo)
+        agora = (resultado['total'] if rota == 'total' else resultado['rotas'][rota])[campo]
+        return f" ({(agora - antes) / antes * 100:+.0f}%)" if antes else ''
+
+    print(f"{'rota':<26}{'req':>7}{'erros':>7}{'req/s':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for rota, r in list(resultado['rotas'].items()) + [('total', resultado['total'])]:
+        print(f"{rota:<26}{r['requisicoes']:>7}{r['erros']:>7}{r['rps']:>9.1f}{r['p50_ms']:>10.1f}"
+              f"{r['p95_ms']:>10.1f}{r['p99_ms']:>10.1f}")
+        if anterior:
+            print(f"{'':<26}{'':>14}{variacao(rota, 'rps'):>9}{variacao(rota, 'p50_ms'):>10}"
+                  f"{variacao(rota, 'p95_ms'):>10}{variacao(rota, 'p99_ms'):>10}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--usuarios', type=int, default=1000, help='usuários do popular-banco (banco vazio)')
+    parser.add_argument('--animais', type=int, default=50000, help='anúncios do popular-banco (banco vazio)')
+    parser.add_argument('--senha', default='senha123')
+    parser.add_argument('--threads', type=int, default=8)
+    parser.add_argument('--duracao', type=float, default=30, help='segundos de carga')
+    parser.add_argument('--semente', type=int, default=42)
+    parser.add_argument('--metodo-senha', help='SENHA_METODO (padrão: o do app; o login domina o tempo)')
+    parser.add_argument('--saida', help='arquivo JSON (padrão: benchmarks/resultados/carga-<commit>-<data>.json)')
+    parser.add_argument('--comparar', help='JSON de uma execução anterior para mostrar a variação')
+    args = parser.parse_args()
+    if args.metodo_senha:
+        os.environ['SENHA_METODO'] = args.metodo_senha
+
+    import app as adoteja
+    from app import app, db, Usuario as ModeloUsuario
+
+    with app.app_context():
+        db.create_all()
+        if not db.session.query(ModeloUsuario.id).first():
+            saida = app.test_cli_runner().invoke(args=[
+                'popular-banco', '--usuarios', str(args.usuarios), '--animais', str(args.animais),
+                '--senha', args.senha, '--semente', str(args.semente)])
+            if saida.exit_code:
+                raise SystemExit(saida.output)
+        ids = db.session.query(db.func.min(ModeloUsuario.id), db.func.max(ModeloUsuario.id)).one()
+        banco = {'dialeto': db.engine.dialect.name, 'usuarios': ModeloUsuario.query.count(),
+                 'animais': adoteja.Animal.query.count()}
+
+    amostras, erros, duracao = rodar(app, adoteja, args, ids)
+    rotas, total = resumo(amostras, erros, duracao)
+    resultado = {
+        'commit': commit_atual(),
+        'data': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'banco': banco,
+        'parametros': {'threads': args.threads, 'duracao_s': args.duracao, 'semente': args.semente,
+                       'senha_metodo': app.config['SENHA_METODO'], 'mistura': MISTURA},
+        'total': total,
+        'rotas': rotas,
+    }
+
+    anterior = None
+    if args.comparar:
+        with open(os.path.join(ORIGEM, args.comparar), 'r', encoding='utf-8') as f:
+            anterior = json.load(f)
+        print(f"Comparando com {anterior['commit']} ({anterior['data']})")
+    imprimir(resultado, anterior)
+
+    saida = os.path.join(ORIGEM, args.saida) if args.saida else os.path.join(RAIZ, 'benchmarks', 'resultados',
+                                       f"carga-{resultado['commit']}-{datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(saida)), exist_ok=True)
+    with open(saida, 'w', encoding='utf-8') as f:
+        json.dump(resultado, f, ensure_ascii=False, indent=2)
+    print(f"Resultado gravado em {saida}")
+
+
+if __name__ == '__main__':
+    main()
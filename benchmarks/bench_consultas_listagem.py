@@ -0,0 +1,71 @@
+"""Conta os comandos SQL emitidos por página da listagem.
+
+Popula um SQLite temporário com animais de doadores diferentes e renderiza
+/listar_animais com páginas de tamanhos variados. O número de comandos por
+requisição deve ser o mesmo para qualquer quantidade de cards; se variar
+(ex.: um SELECT por doador), o script termina com código 1.
+
+Uso:
+    python benchmarks/bench_consultas_listagem.py
+"""
+import os
+import sys
+import tempfile
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+_arquivo_db = os.path.join(tempfile.mkdtemp(prefix='adoteja-consultas-'), 'consultas.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{_arquivo_db}'
+
+from sqlalchemy import event  # noqa: E402
+from werkzeug.security import generate_password_hash  # noqa: E402
+
+from app import app, db, Animal, Usuario  # noqa: E402
+
+TAMANHOS = [1, 5, 20, 60]
+
+
+def popular(qtd):
+    senha = generate_password_hash('senha')
+    for i in range(qtd + 1):
+        db.session.add(Usuario(nome=f'Doador {i}', email=f'doador{i}@exemplo.com', senha=senha,
+                               telefone='(43) 99999-0000', estado='PR', cidade='Londrina',
+                               email_confirmado=True))
+    db.session.flush()
+    for i in range(qtd):
+        db.session.add(Animal(usuario_id=i + 2, nome=f'Pet {i}', especie='Cachorro', raca='SRD Porte Médio',
+                              sexo='Macho', estado='PR', cidade='Londrina'))
+    db.session.commit()
+
+
+def main():
+    app.config['ANIMAIS_POR_PAGINA_MAX'] = max(TAMANHOS)
+    with app.app_context():
+        db.create_all()
+        popular(max(TAMANHOS))
+        engine = db.engine
+
+    comandos = []
+    event.listen(engine, 'before_cursor_execute', lambda *args: comandos.append(args[2]))
+
+    cliente = app.test_client()
+    cliente.post('/login', data={'email': 'doador0@exemplo.com', 'senha': 'senha'})
+    cliente.get('/listar_animais')  # aquece caches (ex.: usuário logado) antes de contar
+
+    contagens = {}
+    for tamanho in TAMANHOS:
+        comandos.clear()
+        resposta = cliente.get(f'/listar_animais?por_pagina={tamanho}')
+        assert resposta.status_code == 200, resposta.status_code
+        contagens[tamanho] = len(comandos)
+        print(f"{tamanho:>4} cards: {len(comandos)} comandos SQL")
+
+    if len(set(contagens.values())) != 1:
+        print("ERRO: o número de comandos SQL varia com a quantidade de cards (N+1).")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
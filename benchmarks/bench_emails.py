@@ -0,0 +1,142 @@
+"""Caixa de saída de e-mails contra um servidor SMTP local de teste.
+
+Sobe um SMTP mínimo em 127.0.0.1 (com atraso configurável por mensagem),
+mede o tempo de POST /esqueci_senha, que só grava o e-mail, e depois
+esvazia a fila contando conexões SMTP, entregas e latência. Em seguida
+derruba o servidor para conferir que os envios são adiados com espera
+crescente e entregues quando ele volta.
+
+Uso:
+    python benchmarks/bench_emails.py --emails 200 --atraso 0.05
+"""
+import argparse
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+
+class ServidorSMTP(socketserver.ThreadingTCPServer):
+    """SMTP só com o necessário para o smtplib: aceita tudo e conta conexões e mensagens."""
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, atraso):
+        super().__init__(('127.0.0.1', 0), TratadorSMTP)
+        self.atraso = atraso
+        self.conexoes = 0
+        self.mensagens = 0
+        self.lock = threading.Lock()
+
+
+class TratadorSMTP(socketserver.StreamRequestHandler):
+    def responder(self, linha):
+        self.wfile.write(linha.encode() + b'\r\n')
+
+    def handle(self):
+        with self.server.lock:
+            self.server.conexoes += 1
+        self.responder('220 teste')
+        while True:
+            linha = self.rfile.readline()
+            if not linha:
+                return
+            comando = linha.decode(errors='replace').strip().upper()
+            if comando.startswith(('EHLO', 'HELO')):
+                self.responder('250 teste')
+            elif comando == 'DATA':
+                self.responder('354 fim com .')
+                while self.rfile.readline() not in (b'.\r\n', b''):
+                    pass
+                time.sleep(self.server.atraso)
+                with self.server.lock:
+                    self.server.mensagens += 1
+                self.responder('250 ok')
+            elif comando == 'QUIT':
+                self.responder('221 tchau')
+                return
+            else:
+                self.responder('250 ok')
+
+
+def porta_livre():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--emails', type=int, default=200)
+    parser.add_argument('--atraso', type=float, default=0.05, help='segundos por mensagem no servidor de teste')
+    args = parser.parse_args()
+
+    servidor = ServidorSMTP(args.atraso)
+    threading.Thread(target=servidor.serve_forever, daemon=True).start()
+
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='adoteja-emails-'), 'emails.db')}"
+    os.environ['MAIL_SERVER'] = '127.0.0.1'
+    os.environ['MAIL_PORT'] = str(servidor.server_address[1])
+    os.environ['MAIL_USE_TLS'] = '0'
+    os.environ['MAIL_USERNAME'] = ''
+    os.environ['EMAIL_EM_PROCESSO'] = '0'  # o script controla o envio
+
+    from werkzeug.security import generate_password_hash
+    from app import app, db, caixa_saida, enfileirar_email, EmailPendente, Usuario
+
+    with app.app_context():
+        db.create_all()
+        db.session.add(Usuario(nome='Teste', email='teste@exemplo.com', senha=generate_password_hash('x'),
+                               email_confirmado=True))
+        db.session.commit()
+
+    cliente = app.test_client()
+    inicio = time.perf_counter()
+    resposta = cliente.post('/esqueci_senha', data={'email': 'teste@exemplo.com'})
+    print(f"POST /esqueci_senha: {resposta.status_code} em {(time.perf_counter() - inicio) * 1000:.1f} ms "
+          f"(servidor SMTP leva {args.atraso * 1000:.0f} ms por mensagem)")
+
+    with app.app_context():
+        for i in range(args.emails - 1):
+            enfileirar_email(f'pessoa{i}@exemplo.com', 'Teste', '<p>Olá</p>')
+        db.session.commit()
+
+        inicio = time.perf_counter()
+        while caixa_saida.enviar_lote() >= app.config['EMAIL_LOTE']:
+            pass
+        caixa_saida._fechar_conexao()
+        duracao = time.perf_counter() - inicio
+        print(f"{servidor.mensagens} e-mails entregues em {duracao:.2f}s "
+              f"usando {servidor.conexoes} conexão(ões) SMTP ({servidor.mensagens / duracao:.0f}/s)")
+        print(caixa_saida.estatisticas())
+
+        # Servidor fora do ar: o lote inteiro é adiado com uma única tentativa de conexão
+        app.extensions['mail'].port = porta_livre()
+        enfileirar_email('atrasado@exemplo.com', 'Teste', '<p>Olá</p>')
+        db.session.commit()
+        caixa_saida.enviar_lote()
+        email = EmailPendente.query.filter_by(destinatario='atrasado@exemplo.com').one()
+        print(f"Servidor fora do ar: tentativas={email.tentativas}, "
+              f"próxima em {(email.proxima_tentativa - email.criado_em).total_seconds():.0f}s, erro={email.ultimo_erro!r}")
+
+        app.extensions['mail'].port = servidor.server_address[1]
+        email.proxima_tentativa = email.criado_em
+        db.session.commit()
+        caixa_saida.enviar_lote()
+        caixa_saida._fechar_conexao()
+        print(f"Servidor de volta: enviado_em={db.session.get(EmailPendente, email.id).enviado_em}")
+
+    if servidor.mensagens != args.emails + 1:
+        print("ERRO: nem todos os e-mails foram entregues.")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""Compara a listagem renderizada de uma vez com a listagem em fluxo.
+
+Popula um SQLite temporário com anúncios e, para cada tamanho de página,
+mede em processos separados (um por modo) o tempo até o primeiro byte, o
+tempo total e o aumento do pico de memória (RSS) do processo durante a
+requisição. Confere também se os dois modos geram o mesmo HTML.
+
+Uso:
+    python benchmarks/bench_fluxo.py --animais 2000 --paginas 20 200 1000
+"""
+import argparse
+import hashlib
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+if 'DATABASE_URL' not in os.environ:
+    _arquivo_db = os.path.join(tempfile.mkdtemp(prefix='adoteja-fluxo-'), 'fluxo.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{_arquivo_db}'
+
+from sqlalchemy import insert  # noqa: E402
+from werkzeug.security import generate_password_hash  # noqa: E402
+
+import app as adoteja  # noqa: E402
+from app import app, db, Animal, Usuario  # noqa: E402
+
+
+def popular(qtd):
+    agora = adoteja.agora_sp()
+    db.session.add(Usuario(nome='Doador', email='doador@exemplo.com', senha=generate_password_hash('senha'),
+                           telefone='(43) 99999-0000', estado='PR', cidade='Londrina', email_confirmado=True))
+    db.session.flush()
+    db.session.execute(insert(Animal), [
+        {'usuario_id': 1, 'nome': f'Pet {i}', 'especie': 'Cachorro', 'raca': 'SRD Porte Médio', 'sexo': 'Macho',
+         'estado': 'PR', 'cidade': 'Londrina', 'foto': f'{i:064x}', 'criado_em': agora - adoteja.timedelta(minutes=i),
+         'atualizado_em': agora, 'ativo': True, 'data_validade': agora + adoteja.timedelta(days=30)}
+        for i in range(qtd)
+    ])
+    db.session.commit()
+
+
+def medir(em_fluxo, por_pagina):
+    """Roda no processo filho: uma requisição pequena de aquecimento e a medida."""
+    app.config['LISTAGEM_EM_FLUXO'] = em_fluxo
+    app.config['ANIMAIS_POR_PAGINA_MAX'] = por_pagina
+    cliente = app.test_client()
+    cliente.post('/login', data={'email': 'doador@exemplo.com', 'senha': 'senha'})
+    cliente.get('/listar_animais?por_pagina=1').close()
+
+    pico_antes = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    inicio = time.perf_counter()
+    resposta = cliente.get(f'/listar_animais?por_pagina={por_pagina}', buffered=False)
+    pedacos = iter(resposta.response)
+    primeiro = next(pedacos)
+    ttfb = time.perf_counter() - inicio
+    hash_html = hashlib.sha1(primeiro)
+    tamanho = len(primeiro)
+    for pedaco in pedacos:
+        hash_html.update(pedaco)
+        tamanho += len(pedaco)
+    resposta.close()
+    total = time.perf_counter() - inicio
+    pico_depois = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return {'ttfb_ms': ttfb * 1000, 'total_ms': total * 1000, 'rss_kb': pico_depois - pico_antes,
+            'bytes': tamanho, 'sha1': hash_html.hexdigest()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--animais', type=int, default=2000)
+    parser.add_argument('--paginas', type=int, nargs='+', default=[20, 200, 1000])
+    parser.add_argument('--medir', nargs=2, metavar=('MODO', 'POR_PAGINA'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.medir:
+        modo, por_pagina = args.medir
+        print(json.dumps(medir(modo == 'fluxo', int(por_pagina))))
+        return
+
+    with app.app_context():
+        db.create_all()
+        if not Animal.query.first():
+            popular(max(args.animais, max(args.paginas)))
+
+    for por_pagina in args.paginas:
+        resultados = {}
+        for modo in ('inteira', 'fluxo'):
+            saida = subprocess.run([sys.executable, __file__, '--medir', modo, str(por_pagina)],
+                                   capture_output=True, text=True, check=True, env=os.environ)
+            resultados[modo] = json.loads(saida.stdout.strip().splitlines()[-1])
+            r = resultados[modo]
+            print(f"{por_pagina:>5} cards {modo:<8} TTFB {r['ttfb_ms']:8.1f} ms   total {r['total_ms']:8.1f} ms   "
+                  f"pico RSS +{r['rss_kb'] / 1024:6.1f} MB   {r['bytes'] / 1024:8.0f} KB")
+        if resultados['inteira']['sha1'] != resultados['fluxo']['sha1']:
+            print("ERRO: o HTML em fluxo difere da página renderizada de uma vez.")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,129 @@
+"""Compara a geração das variantes das fotos antes e depois do draft/reduce.
+
+Para cada modo ("atual": decodifica a foto inteira, como antes; "draft":
+imagens.gerar_variantes, que decodifica já perto do tamanho das variantes)
+roda um processo separado que gera as variantes de todas as fotos de
+--pasta (padrão static/uploads/img_animais/) e mostra o tempo por foto e o
+pico de memória (RSS) do processo. As fotos do repositório são pequenas;
+--camera N acrescenta N JPEGs sintéticos de 12 MP com orientação EXIF, como
+os de celular.
+
+Uso:
+    python benchmarks/bench_fotos.py --camera 10
+"""
+import argparse
+import json
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+
+from PIL import Image, ImageDraw  # noqa: E402
+
+import imagens  # noqa: E402
+
+
+def variantes_atual(origem, pasta_destino, base):
+    """gerar_variantes de antes: abre a foto em resolução cheia, sem orientação nem limites."""
+    with Image.open(origem) as original:
+        imagem = imagens._para_rgb(original)
+        for _, largura, quadrada in imagens.VARIANTES_FOTO:
+            variante = imagens._redimensionar(imagem, largura, quadrada)
+            for extensao, formato, opcoes in imagens.FORMATOS_VARIANTE:
+                variante.save(os.path.join(pasta_destino, imagens.nome_variante(base, largura, extensao)),
+                              format=formato, **opcoes)
+    os.remove(origem)
+
+
+def fotos_de_camera(pasta, quantidade):
+    caminhos = []
+    for i in range(quantidade):
+        foto = Image.new('RGB', (4032, 3024), (40 + i * 20 % 200, 120, 90))
+        desenho = ImageDraw.Draw(foto)
+        for j in range(0, 4032, 48):  # detalhe para o JPEG não ficar trivial
+            desenho.line([(j, 0), (4032 - j, 3024)], fill=(j % 255, 200, 255 - j % 255), width=7)
+        exif = Image.Exif()
+        exif[0x0112] = 6  # orientação: girar 90° (retrato tirado com o celular de pé)
+        exif[0x010F] = 'Camera'
+        caminho = os.path.join(pasta, f'camera{i}.jpg')
+        foto.save(caminho, quality=92, exif=exif)
+        caminhos.append(caminho)
+    return caminhos
+
+
+def pico_memoria_mb():
+    """Pico de RSS do processo: VmHWM no Linux (ru_maxrss herda o pico do processo pai)."""
+    try:
+        with open('/proc/self/status') as status:
+            for linha in status:
+                if linha.startswith('VmHWM:'):
+                    return int(linha.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def rodar_modo(modo, fotos):
+    """Executado no processo filho: gera as variantes e imprime tempos e pico de memória em JSON."""
+    base_mb = pico_memoria_mb()
+    gerar = variantes_atual if modo == 'atual' else imagens.gerar_variantes
+    destino = tempfile.mkdtemp(prefix=f'adoteja-fotos-{modo}-')
+    tempos = []
+    for i, foto in enumerate(fotos):
+        copia = os.path.join(destino, f'{i}.upload')
+        shutil.copyfile(foto, copia)
+        inicio = time.perf_counter()
+        gerar(copia, destino, f'foto{i}')
+        tempos.append(time.perf_counter() - inicio)
+    with Image.open(os.path.join(destino, imagens.nome_variante('foto0', 1200, 'jpg'))) as exemplo:
+        tamanho = exemplo.size
+    shutil.rmtree(destino)
+    print(json.dumps({'tempos': tempos, 'base_mb': base_mb, 'tamanho_primeira': tamanho,
+                      'pico_mb': pico_memoria_mb()}))
+
+
+def medir(modo, fotos):
+    saida = subprocess.run([sys.executable, __file__, '--modo', modo, *fotos], check=True,
+                           capture_output=True, text=True).stdout
+    return json.loads(saida)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--pasta', default=os.path.join(RAIZ, 'static', 'uploads', 'img_animais'))
+    parser.add_argument('--camera', type=int, default=0)
+    parser.add_argument('--modo', choices=['atual', 'draft'], help=argparse.SUPPRESS)
+    parser.add_argument('fotos', nargs='*', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.modo:
+        return rodar_modo(args.modo, args.fotos)
+
+    grupos = {}
+    if os.path.isdir(args.pasta):
+        grupos[os.path.relpath(args.pasta, RAIZ)] = sorted(
+            os.path.join(args.pasta, nome) for nome in os.listdir(args.pasta)
+            if os.path.isfile(os.path.join(args.pasta, nome)))
+    if args.camera:
+        grupos[f'{args.camera} fotos de câmera 4032x3024'] = fotos_de_camera(
+            tempfile.mkdtemp(prefix='adoteja-camera-'), args.camera)
+
+    for rotulo, fotos in grupos.items():
+        if not fotos:
+            continue
+        print(f"{rotulo} ({len(fotos)} fotos)")
+        for modo in ('atual', 'draft'):
+            resultado = medir(modo, fotos)
+            tempos = sorted(resultado['tempos'])
+            print(f"  {modo:<6} total {sum(tempos):6.2f}s   mediana {tempos[len(tempos) // 2] * 1000:7.1f} ms/foto   "
+                  f"pico RSS {resultado['pico_mb']:6.0f} MB (antes das fotos {resultado['base_mb']:.0f} MB)   "
+                  f"1ª foto em 1200 px: {resultado['tamanho_primeira'][0]}x{resultado['tamanho_primeira'][1]}")
+
+
+if __name__ == '__main__':
+    main()
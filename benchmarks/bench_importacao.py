@@ -0,0 +1,80 @@
+"""Mede `flask animais import` e `flask animais export`.
+
+Gera um CSV com --linhas anúncios (um terço com foto, entre --fotos arquivos
+diferentes), importa para um SQLite temporário e exporta de volta em JSONL,
+mostrando linhas/s e o pico de memória (RSS) de cada etapa. Cada etapa roda
+em um processo próprio, para o pico de uma não esconder o da outra.
+
+Uso:
+    python benchmarks/bench_importacao.py --linhas 100000 --fotos 50
+"""
+import argparse
+import csv
+import os
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def gerar_arquivos(pasta, linhas, fotos):
+    from PIL import Image
+    os.makedirs(os.path.join(pasta, 'fotos'))
+    for i in range(fotos):
+        Image.new('RGB', (1600, 1200), (i * 37 % 256, i * 91 % 256, 120)).save(
+            os.path.join(pasta, 'fotos', f'foto{i}.jpg'), quality=90)
+    aleatorio = random.Random(42)
+    with open(os.path.join(pasta, 'abrigo.csv'), 'w', encoding='utf-8', newline='') as f:
+        escritor = csv.writer(f)
+        escritor.writerow(['nome', 'especie', 'raca', 'sexo', 'vacinado', 'castrado', 'estado', 'cidade', 'foto'])
+        for i in range(linhas):
+            especie = aleatorio.choice(['Cachorro', 'Gato'])
+            escritor.writerow([f'Pet {i}', especie, 'SRD' if especie == 'Gato' else 'SRD Porte Médio',
+                               aleatorio.choice(['Macho', 'Fêmea']), aleatorio.choice(['sim', 'não', 'não sei']),
+                               'não sei', 'PR', aleatorio.choice(['Londrina', 'Maringá', 'Curitiba']),
+                               f'foto{aleatorio.randrange(fotos)}.jpg' if fotos and i % 3 == 0 else ''])
+
+
+def flask(pasta, *args):
+    """Roda `flask --app app ...` na pasta temporária e devolve (segundos, pico de RSS em MB do filho)."""
+    ambiente = dict(os.environ, PYTHONPATH=RAIZ, EMAIL_EM_PROCESSO='0',
+                    DATABASE_URL=f"sqlite:///{os.path.join(pasta, 'importacao.db')}")
+    inicio = time.perf_counter()
+    subprocess.run([sys.executable, '-m', 'flask', '--app', 'app', *args], cwd=pasta, env=ambiente, check=True,
+                   stdout=subprocess.DEVNULL)
+    pico = resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024
+    return time.perf_counter() - inicio, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--linhas', type=int, default=100000)
+    parser.add_argument('--fotos', type=int, default=50)
+    args = parser.parse_args()
+
+    pasta = tempfile.mkdtemp(prefix='adoteja-importacao-')
+    gerar_arquivos(pasta, args.linhas, args.fotos)
+    criar = ("from app import app, db, Usuario\n"
+             "with app.app_context():\n"
+             "    db.create_all()\n"
+             "    db.session.add(Usuario(nome='Abrigo', email='abrigo@exemplo.com', senha='x', email_confirmado=True))\n"
+             "    db.session.commit()\n")
+    subprocess.run([sys.executable, '-c', criar], cwd=pasta, check=True,
+                   env=dict(os.environ, PYTHONPATH=RAIZ, EMAIL_EM_PROCESSO='0',
+                            DATABASE_URL=f"sqlite:///{os.path.join(pasta, 'importacao.db')}"))
+
+    duracao, pico = flask(pasta, 'animais', 'import', 'abrigo.csv', '--usuario', 'abrigo@exemplo.com',
+                          '--fotos', 'fotos')
+    print(f"import: {args.linhas} linhas, {args.fotos} fotos em {duracao:.1f}s "
+          f"({args.linhas / duracao:,.0f} linhas/s), pico RSS {pico:.0f} MB")
+    duracao, pico = flask(pasta, 'animais', 'export', 'exportado.jsonl')
+    print(f"export: {args.linhas} linhas em {duracao:.1f}s ({args.linhas / duracao:,.0f} linhas/s), "
+          f"pico RSS até aqui {pico:.0f} MB")
+
+
+if __name__ == '__main__':
+    main()
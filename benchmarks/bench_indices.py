@@ -0,0 +1,183 @@
+"""Benchmark dos índices da tabela animais.
+
+Popula um banco SQLite temporário (ou o banco de DATABASE_URL, se informado)
+com animais sintéticos e, para cada combinação de filtros da listagem, de
+meus anúncios e da expiração, grava o plano de execução e o tempo médio
+SEM e COM os índices do modelo.
+
+Uso:
+    python benchmarks/bench_indices.py --animais 100000 --saida resultado.json
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+if 'DATABASE_URL' not in os.environ:
+    _arquivo_db = os.path.join(tempfile.mkdtemp(prefix='adoteja-bench-'), 'bench.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{_arquivo_db}'
+
+from sqlalchemy import insert  # noqa: E402
+
+import app as adoteja  # noqa: E402
+from app import app, db, Animal, Usuario  # noqa: E402
+
+COMBINACOES = [
+    {},
+    {'especie': 'Cachorro'},
+    {'especie': 'Cachorro', 'raca': 'Pug'},
+    {'sexo': 'Fêmea'},
+    {'vacinado': '1'},
+    {'castrado': '1'},
+    {'estado': 'SP'},
+    {'estado': 'SP', 'cidade': 'Campinas'},
+    {'especie': 'Gato', 'estado': 'PR', 'cidade': 'Londrina'},
+    {'especie': 'Cachorro', 'raca': 'Pug', 'sexo': 'Macho', 'vacinado': '1', 'castrado': '1',
+     'estado': 'SP', 'cidade': 'Campinas'},
+]
+
+RACAS = {
+    'Cachorro': ['SRD Porte Pequeno', 'SRD Porte Médio', 'Poodle', 'Pug', 'Beagle', 'Shih Tzu'],
+    'Gato': ['SRD', 'Persa', 'Siamês', 'Maine Coon'],
+}
+
+
+def popular(qtd_animais, qtd_usuarios):
+    geo = adoteja.catalogo_geo()
+    ufs = list(geo.cidades_por_estado)
+    agora = adoteja.agora_sp()
+    aleatorio = random.Random(42)
+
+    db.session.execute(insert(Usuario), [
+        {'nome': f'Usuário {i}', 'email': f'bench{i}@exemplo.com', 'senha': 'x', 'email_confirmado': True}
+        for i in range(qtd_usuarios)
+    ])
+    lote = []
+    for i in range(qtd_animais):
+        especie = aleatorio.choice(list(RACAS))
+        uf = aleatorio.choice(ufs)
+        criado_em = agora - timedelta(minutes=aleatorio.randint(0, 60 * 24 * 60))
+        lote.append({
+            'usuario_id': aleatorio.randint(1, qtd_usuarios),
+            'nome': f'Pet {i}',
+            'especie': especie,
+            'raca': aleatorio.choice(RACAS[especie]),
+            'sexo': aleatorio.choice(['Macho', 'Fêmea']),
+            'vacinado': aleatorio.randint(0, 2),
+            'castrado': aleatorio.randint(0, 2),
+            'estado': uf,
+            'cidade': aleatorio.choice(geo.cidades_por_estado[uf]),
+            'criado_em': criado_em,
+            'ativo': aleatorio.random() < 0.8,
+            'data_validade': criado_em + timedelta(days=30),
+        })
+        if len(lote) >= 5000:
+            db.session.execute(insert(Animal), lote)
+            lote = []
+    if lote:
+        db.session.execute(insert(Animal), lote)
+    db.session.commit()
+
+
+def consultas():
+    """Retorna (nome, query) para cada padrão de acesso medido."""
+    por_pagina = app.config['ANIMAIS_POR_PAGINA']
+    for filtros in COMBINACOES:
+        query = adoteja.filtrar_animais(Animal.query, filtros).filter(Animal.ativo == True)
+        query = query.order_by(Animal.criado_em.desc(), Animal.id.desc()).limit(por_pagina)
+        nome = 'listar_animais ' + (json.dumps(filtros, ensure_ascii=False) if filtros else '(sem filtros)')
+        yield nome, query
+    yield 'meus_anuncios', Animal.query.filter_by(usuario_id=1).order_by(Animal.criado_em.desc())
+    yield 'expiracao', Animal.query.with_entities(Animal.id).filter(
+        Animal.ativo == True, Animal.data_validade <= adoteja.agora_sp()
+    )
+
+
+def explicar(query):
+    compilado = query.statement.compile(dialect=db.engine.dialect)
+    sql = str(compilado)
+    if compilado.positional:
+        parametros = tuple(compilado.params[nome] for nome in compilado.positiontup)
+    else:
+        parametros = compilado.params
+    prefixo = 'EXPLAIN QUERY PLAN ' if db.engine.dialect.name == 'sqlite' else 'EXPLAIN '
+    with db.engine.connect() as conexao:
+        linhas = conexao.exec_driver_sql(prefixo + sql, parametros).fetchall()
+    return [' | '.join(str(coluna) for coluna in linha) for linha in linhas]
+
+
+def medir(query, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        query.all()
+        tempos.append(time.perf_counter() - inicio)
+    tempos.sort()
+    return {'media_ms': round(sum(tempos) / len(tempos) * 1000, 3),
+            'mediana_ms': round(tempos[len(tempos) // 2] * 1000, 3)}
+
+
+def rodada(repeticoes):
+    resultado = {}
+    for nome, query in consultas():
+        resultado[nome] = {'plano': explicar(query), **medir(query, repeticoes)}
+        db.session.rollback()
+    return resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--animais', type=int, default=50000)
+    parser.add_argument('--usuarios', type=int, default=2000)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    parser.add_argument('--saida', help='arquivo JSON para gravar o resultado')
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        if not Animal.query.first():
+            popular(args.animais, args.usuarios)
+
+        indices = list(Animal.__table__.indexes)
+        for indice in indices:
+            indice.drop(db.engine, checkfirst=True)
+        antes = rodada(args.repeticoes)
+
+        for indice in indices:
+            indice.create(db.engine, checkfirst=True)
+        with db.engine.begin() as conexao:
+            if db.engine.dialect.name == 'sqlite':
+                conexao.exec_driver_sql('ANALYZE')
+            else:
+                conexao.exec_driver_sql(f'ANALYZE TABLE {Animal.__tablename__}')
+        depois = rodada(args.repeticoes)
+        banco = db.engine.dialect.name
+
+    relatorio = {
+        'banco': banco,
+        'animais': args.animais,
+        'repeticoes': args.repeticoes,
+        'consultas': {nome: {'antes': antes[nome], 'depois': depois[nome]} for nome in antes},
+    }
+
+    for nome, dados in relatorio['consultas'].items():
+        print(f"{nome}\n    sem índices: {dados['antes']['media_ms']:>9.3f} ms"
+              f"    com índices: {dados['depois']['media_ms']:>9.3f} ms")
+        for linha in dados['depois']['plano']:
+            print(f"        {linha}")
+
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as f:
+            json.dump(relatorio, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == '__main__':
+    main()
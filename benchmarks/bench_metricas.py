@@ -0,0 +1,75 @@
+"""Mede o custo das métricas por requisição (METRICAS_ATIVAS) na listagem.
+
+Popula um SQLite temporário e alterna blocos de requisições com as métricas
+ligadas e desligadas, comparando a mediana do tempo por requisição. No fim
+mostra um trecho do /metrics.
+
+Uso:
+    python benchmarks/bench_metricas.py --requisicoes 2000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+_arquivo_db = os.path.join(tempfile.mkdtemp(prefix='adoteja-metricas-'), 'metricas.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{_arquivo_db}'
+os.environ['EMAIL_EM_PROCESSO'] = '0'
+
+from app import app, db  # noqa: E402
+
+
+def medir(cliente, url, quantidade):
+    tempos = []
+    for _ in range(quantidade):
+        inicio = time.perf_counter()
+        cliente.get(url).close()  # o servidor WSGI fecha a resposta; é quando a requisição é medida
+        tempos.append(time.perf_counter() - inicio)
+    return tempos
+
+
+def mediana(valores):
+    return sorted(valores)[len(valores) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requisicoes', type=int, default=2000)
+    parser.add_argument('--blocos', type=int, default=10)
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+    saida = app.test_cli_runner().invoke(args=['popular-banco', '--usuarios', '200', '--animais', '5000'])
+    assert saida.exit_code == 0, saida.output
+
+    cliente = app.test_client()
+    cliente.post('/login', data={'email': 'usuario1@exemplo.com', 'senha': 'senha123'}).close()
+    url = '/listar_animais?especie=Cachorro'
+    medir(cliente, url, 50)  # aquece templates e caches
+
+    tempos = {True: [], False: []}
+    por_bloco = args.requisicoes // (2 * args.blocos) or 1
+    for _ in range(args.blocos):
+        for ativas in (True, False):
+            app.config['METRICAS_ATIVAS'] = ativas
+            tempos[ativas] += medir(cliente, url, por_bloco)
+    app.config['METRICAS_ATIVAS'] = True
+
+    com, sem = mediana(tempos[True]) * 1000, mediana(tempos[False]) * 1000
+    print(f"{url}: sem métricas {sem:.3f} ms   com métricas {com:.3f} ms   "
+          f"custo {(com - sem) * 1000:+.0f} µs ({(com - sem) / sem * 100:+.1f}%)")
+
+    texto = cliente.get('/metrics').get_data(as_text=True)
+    for linha in texto.splitlines():
+        if 'listar_animais' in linha and ('_count' in linha or '_sum' in linha):
+            print(linha)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,69 @@
+"""Mede o custo do profiler de requisições na listagem.
+
+Popula um SQLite temporário e mede a mediana de /listar_animais com o
+profiler desligado, com a amostragem de pilhas ligada em todas as requisições
+(limiar alto, nada é gravado) e com cProfile em todas (PROFILER_AMOSTRA=1).
+
+Uso:
+    python benchmarks/bench_profiler.py --requisicoes 300
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+_pasta = tempfile.mkdtemp(prefix='adoteja-profiler-')
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(_pasta, 'profiler.db')}"
+os.environ['PROFILER_DIR'] = os.path.join(_pasta, 'capturas')
+os.environ['EMAIL_EM_PROCESSO'] = '0'
+
+from app import app, db  # noqa: E402
+
+MODOS = {
+    'desligado': {'PROFILER_ATIVO': False},
+    'pilhas (limiar 10 s)': {'PROFILER_ATIVO': True, 'PROFILER_LIMIAR_MS': 10000, 'PROFILER_AMOSTRA': 0},
+    'cProfile em todas': {'PROFILER_ATIVO': True, 'PROFILER_LIMIAR_MS': 0, 'PROFILER_AMOSTRA': 1},
+}
+
+
+def medir(cliente, url, quantidade):
+    tempos = []
+    for _ in range(quantidade):
+        inicio = time.perf_counter()
+        cliente.get(url).close()  # a captura é fechada junto com a resposta
+        tempos.append(time.perf_counter() - inicio)
+    return sorted(tempos)[len(tempos) // 2] * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--requisicoes', type=int, default=300)
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+    saida = app.test_cli_runner().invoke(args=['popular-banco', '--usuarios', '200', '--animais', '5000'])
+    assert saida.exit_code == 0, saida.output
+
+    cliente = app.test_client()
+    cliente.post('/login', data={'email': 'usuario1@exemplo.com', 'senha': 'senha123'}).close()
+    url = '/listar_animais?especie=Cachorro'
+    medir(cliente, url, 50)
+
+    base = None
+    for nome, config in MODOS.items():
+        app.config.update(config)
+        tempo = medir(cliente, url, args.requisicoes)
+        base = base or tempo
+        print(f"{nome:<22} {tempo:7.2f} ms ({(tempo - base) / base * 100:+.1f}%)")
+    capturas = os.listdir(os.environ['PROFILER_DIR']) if os.path.isdir(os.environ['PROFILER_DIR']) else []
+    print(f"Arquivos na pasta de capturas: {len(capturas)} (máximo {app.config['PROFILER_MAX_CAPTURAS']} capturas)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""Benchmark do filtro por distância (parâmetro raio da listagem).
+
+Popula um SQLite temporário (ou o banco de DATABASE_URL) com anúncios
+espalhados pelas cidades do catálogo que têm coordenadas. Sem elas (antes de
+`flask importar-coordenadas`), usa pontos sintéticos dentro do território
+brasileiro. Para cada raio, mede a primeira página ordenada por distância
+pelas células de geohash (índice, ampliando o raio até encher a página) e
+pela varredura que calcula a distância de todas as linhas, e confere se as
+duas devolvem os mesmos anúncios.
+
+Uso:
+    python benchmarks/bench_proximidade.py --animais 200000
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import timedelta
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+if 'DATABASE_URL' not in os.environ:
+    _arquivo_db = os.path.join(tempfile.mkdtemp(prefix='adoteja-proximidade-'), 'proximidade.db')
+    os.environ['DATABASE_URL'] = f'sqlite:///{_arquivo_db}'
+
+from sqlalchemy import insert  # noqa: E402
+
+import app as adoteja  # noqa: E402
+from app import app, db, Animal, Usuario  # noqa: E402
+
+# Origens das consultas: capitais e cidades do interior (lat, lon)
+ORIGENS = {
+    'São Paulo - SP': (-23.5329, -46.6395),
+    'Londrina - PR': (-23.3045, -51.1696),
+    'Manaus - AM': (-3.11866, -60.0212),
+    'Recife - PE': (-8.04666, -34.8771),
+}
+
+
+def pontos(qtd, aleatorio):
+    """(estado, cidade, lat, lon) dos anúncios sintéticos."""
+    coordenadas = list(adoteja.catalogo_geo().coordenadas.items())
+    for i in range(qtd):
+        if coordenadas:
+            (uf, cidade), (lat, lon) = aleatorio.choice(coordenadas)
+        else:
+            # Metade perto das origens (cidades vizinhas), metade espalhada pelo país
+            if i % 2:
+                lat0, lon0 = aleatorio.choice(list(ORIGENS.values()))
+                lat, lon = lat0 + aleatorio.uniform(-3, 3), lon0 + aleatorio.uniform(-3, 3)
+            else:
+                lat, lon = aleatorio.uniform(-33.7, 5.2), aleatorio.uniform(-73.9, -34.8)
+            uf, cidade = 'XX', f'Cidade {round(lat, 1)} {round(lon, 1)}'
+        yield uf, cidade, lat, lon
+
+
+def popular(qtd):
+    aleatorio = random.Random(42)
+    agora = adoteja.agora_sp()
+    db.session.execute(insert(Usuario), [{'nome': 'Doador', 'email': 'doador@exemplo.com', 'senha': 'x'}])
+    lote = []
+    for i, (uf, cidade, lat, lon) in enumerate(pontos(qtd, aleatorio)):
+        lote.append({
+            'usuario_id': 1, 'nome': f'Pet {i}', 'especie': 'Cachorro', 'sexo': 'Macho',
+            'estado': uf, 'cidade': cidade, 'latitude': lat, 'longitude': lon,
+            'geohash': adoteja.codificar_geohash(lat, lon),
+            'criado_em': agora - timedelta(minutes=i), 'data_validade': agora + timedelta(days=30),
+            'ativo': True,
+        })
+        if len(lote) >= 5000:
+            db.session.execute(insert(Animal), lote)
+            lote = []
+    if lote:
+        db.session.execute(insert(Animal), lote)
+    db.session.commit()
+
+
+def primeira_pagina(lat, lon, raio, indice):
+    query = Animal.query.filter(Animal.ativo == True)
+    limite = app.config['ANIMAIS_POR_PAGINA'] + 1
+    if indice:
+        return adoteja.paginar_por_distancia(query, (lat, lon), raio, None, limite)
+    # Mesma ordenação, sem as faixas de geohash nem a caixa: calcula a distância de todas as linhas
+    _, distancia = adoteja.consulta_proximidade(lat, lon, raio)
+    return (query.filter(distancia <= (raio / adoteja.KM_POR_GRAU) ** 2)
+            .add_columns(distancia.label('distancia'))
+            .order_by(distancia, Animal.criado_em.desc(), Animal.id.desc()).limit(limite).all())
+
+
+def medir(funcao, repeticoes):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao()
+        tempos.append(time.perf_counter() - inicio)
+        db.session.rollback()
+    tempos.sort()
+    return tempos[len(tempos) // 2] * 1000, resultado
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--animais', type=int, default=200000)
+    parser.add_argument('--repeticoes', type=int, default=5)
+    args = parser.parse_args()
+
+    with app.app_context():
+        db.create_all()
+        if not Animal.query.first():
+            popular(args.animais)
+        # Sem estatísticas o SQLite estima mal o OR de faixas e prefere outro índice
+        with db.engine.begin() as conexao:
+            conexao.exec_driver_sql('ANALYZE' if db.engine.dialect.name == 'sqlite'
+                                    else f'ANALYZE TABLE {Animal.__tablename__}')
+
+        for nome, (lat, lon) in ORIGENS.items():
+            print(nome)
+            for raio in adoteja.RAIOS_KM:
+                celulas = adoteja.celulas_do_raio(lat, lon, raio)
+                com_indice, resultado = medir(lambda: primeira_pagina(lat, lon, raio, True), args.repeticoes)
+                sem_indice, esperado = medir(lambda: primeira_pagina(lat, lon, raio, False), args.repeticoes)
+                iguais = [a.id for a, _ in resultado] == [a.id for a, _ in esperado]
+                mais_longe = adoteja.distancia_em_km(resultado[-1][1]) if resultado else 0
+                print(f"  {raio:>4} km: geohash {com_indice:7.1f} ms ({len(celulas):>2} células "
+                      f"de {len(celulas[0])} caracteres)   varredura {sem_indice:7.1f} ms   "
+                      f"{len(resultado):>2} na página, até {mais_longe:5.1f} km"
+                      f"{'' if iguais else '   RESULTADOS DIFERENTES'}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""Confere o roteamento para a réplica de leitura com dois SQLite.
+
+Cria um banco primário e uma "réplica" que é uma cópia dele, atualizada só
+quando o script manda (simula o atraso de replicação). Um doador edita o
+perfil e o script confere que ele vê a alteração na hora (lê do primário
+por REPLICA_ATRASO_MAX segundos), que outro usuário continua vendo a
+réplica até a próxima cópia e quantas consultas foram a cada banco. No fim
+mede a listagem lida do primário e da réplica.
+
+Uso:
+    python benchmarks/bench_replica.py
+"""
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+_pasta = tempfile.mkdtemp(prefix='adoteja-replica-')
+PRIMARIO = os.path.join(_pasta, 'primario.db')
+REPLICA = os.path.join(_pasta, 'replica.db')
+os.environ['DATABASE_URL'] = f'sqlite:///{PRIMARIO}'
+os.environ['DATABASE_REPLICA_URL'] = f'sqlite:///{REPLICA}'
+os.environ.setdefault('REPLICA_ATRASO_MAX', '1')
+os.environ['EMAIL_EM_PROCESSO'] = '0'
+
+from sqlalchemy import insert  # noqa: E402
+from werkzeug.security import generate_password_hash  # noqa: E402
+
+import app as adoteja  # noqa: E402
+from app import app, db, Animal, Usuario  # noqa: E402
+
+
+def popular():
+    agora = adoteja.agora_sp()
+    senha = generate_password_hash('senha')
+    db.session.execute(insert(Usuario), [
+        {'nome': nome, 'email': f'{nome.lower()}@exemplo.com', 'senha': senha, 'estado': 'PR',
+         'cidade': 'Londrina', 'email_confirmado': True, 'atualizado_em': agora}
+        for nome in ('Ana', 'Bruno')
+    ])
+    db.session.execute(insert(Animal), [
+        {'usuario_id': 1, 'nome': f'Pet {i}', 'especie': 'Cachorro', 'sexo': 'Macho', 'estado': 'PR',
+         'cidade': 'Londrina', 'criado_em': agora - adoteja.timedelta(minutes=i), 'atualizado_em': agora,
+         'ativo': True, 'data_validade': agora + adoteja.timedelta(days=30)}
+        for i in range(200)
+    ])
+    db.session.commit()
+    adoteja.recalcular_facetas()
+
+
+def replicar():
+    """Copia o primário para a réplica (a "replicação" chega)."""
+    with app.app_context():
+        db.engines['replica'].dispose()
+    with sqlite3.connect(PRIMARIO) as origem, sqlite3.connect(REPLICA) as destino:
+        origem.backup(destino)
+
+
+def entrar(email):
+    cliente = app.test_client()
+    cliente.post('/login', data={'email': email, 'senha': 'senha'})
+    return cliente
+
+
+def nome_no_perfil(cliente):
+    return 'Ana Maria' if b'Ana Maria' in cliente.get('/perfil_doador/1').data else 'Ana'
+
+
+def conferir(descricao, obtido, esperado):
+    print(f"  {descricao:<58} {obtido:<10} {'ok' if obtido == esperado else 'ERRO, esperado ' + esperado}")
+    return obtido == esperado
+
+
+def medir(cliente, url, repeticoes=30):
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        cliente.get(url)
+        tempos.append(time.perf_counter() - inicio)
+    tempos.sort()
+    return tempos[len(tempos) // 2] * 1000
+
+
+def main():
+    with app.app_context():
+        db.create_all()
+        popular()
+    replicar()
+
+    ana, bruno = entrar('ana@exemplo.com'), entrar('bruno@exemplo.com')
+    corretos = [conferir('antes da edição, Bruno vê', nome_no_perfil(bruno), 'Ana')]
+
+    ana.post('/editar_perfil', data={'nome': 'Ana Maria', 'email': 'ana@exemplo.com', 'estado': 'PR',
+                                     'cidade': 'Londrina'})
+    corretos += [
+        conferir('logo após editar, Ana (primário) vê', nome_no_perfil(ana), 'Ana Maria'),
+        conferir('Bruno (réplica atrasada) ainda vê', nome_no_perfil(bruno), 'Ana'),
+    ]
+    time.sleep(app.config['REPLICA_ATRASO_MAX'] + 0.1)
+    corretos.append(conferir('passado REPLICA_ATRASO_MAX, Ana volta à réplica e vê', nome_no_perfil(ana), 'Ana'))
+    replicar()
+    corretos += [
+        conferir('depois da replicação, Ana vê', nome_no_perfil(ana), 'Ana Maria'),
+        conferir('depois da replicação, Bruno vê', nome_no_perfil(bruno), 'Ana Maria'),
+    ]
+    print(f"  consultas: {dict(adoteja.consultas_por_banco)}")
+
+    url = '/listar_animais?por_pagina=40'
+    na_replica = medir(bruno, url)
+    app.config['DATABASE_REPLICA_URL'] = None  # escolher_banco deixa tudo no primário
+    no_primario = medir(bruno, url)
+    print(f"  {url}: réplica {na_replica:.1f} ms   primário {no_primario:.1f} ms")
+    with app.app_context():
+        print(f"  pools: {adoteja.estatisticas_banco()['pools']}")
+    sys.exit(0 if all(corretos) else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,119 @@
+"""Micro-benchmark do hash de senhas e do login sob concorrência.
+
+Mede hashes/s (sequencial e pelo pool), a latência de POST /login com várias
+threads ao mesmo tempo (p50/p99 e quantos foram recusados por SenhasOcupadas)
+e a de uma página barata servida durante a rajada. Também confere que um hash
+antigo é regravado com o SENHA_METODO atual no login.
+
+Uso:
+    python benchmarks/bench_senhas.py --threads 16 --logins 20 --metodo pbkdf2:sha256:600000
+"""
+import argparse
+import os
+import sys
+import tempfile
+import threading
+import time
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.chdir(RAIZ)
+
+
+def percentil(valores, p):
+    valores = sorted(valores)
+    return valores[min(len(valores) - 1, int(len(valores) * p))] if valores else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--threads', type=int, default=16)
+    parser.add_argument('--logins', type=int, default=20, help='logins por thread')
+    parser.add_argument('--hashes', type=int, default=20)
+    parser.add_argument('--metodo', help='SENHA_METODO (padrão: o do app)')
+    args = parser.parse_args()
+
+    os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='adoteja-senhas-'), 'senhas.db')}"
+    if args.metodo:
+        os.environ['SENHA_METODO'] = args.metodo
+
+    from werkzeug.security import generate_password_hash
+    from app import app, db, Usuario, gerar_hash_senha, precisa_rehash
+
+    print(f"SENHA_METODO={app.config['SENHA_METODO']} SENHA_WORKERS={app.config['SENHA_WORKERS']} "
+          f"SENHA_FILA_MAX={app.config['SENHA_FILA_MAX']} SENHA_FILA_TIMEOUT={app.config['SENHA_FILA_TIMEOUT']}s")
+
+    with app.app_context():
+        db.create_all()
+        inicio = time.perf_counter()
+        for _ in range(args.hashes):
+            generate_password_hash('senha', app.config['SENHA_METODO'])
+        print(f"Sequencial, na thread da requisição: {args.hashes / (time.perf_counter() - inicio):.1f} hashes/s")
+
+        threads = [threading.Thread(target=lambda: [gerar_hash_senha('senha') for _ in range(args.hashes // 4 or 1)])
+                   for _ in range(8)]
+        inicio = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        total = len(threads) * (args.hashes // 4 or 1)
+        print(f"Pool com 8 threads pedindo: {total / (time.perf_counter() - inicio):.1f} hashes/s")
+
+        db.session.add(Usuario(nome='Atual', email='atual@exemplo.com', senha=gerar_hash_senha('senha'),
+                               email_confirmado=True))
+        db.session.add(Usuario(nome='Antigo', email='antigo@exemplo.com',
+                               senha=generate_password_hash('senha', 'pbkdf2:sha256:1000'), email_confirmado=True))
+        db.session.commit()
+
+    cliente = app.test_client()
+    cliente.post('/login', data={'email': 'antigo@exemplo.com', 'senha': 'senha'})
+    with app.app_context():
+        antigo = Usuario.query.filter_by(email='antigo@exemplo.com').one()
+        print(f"Hash antigo regravado no login: {not precisa_rehash(antigo.senha)} ({antigo.senha.split('$', 1)[0]})")
+
+    latencias, recusados, paginas = [], [0], []
+    lock = threading.Lock()
+    fim = threading.Event()
+
+    def logar():
+        cliente = app.test_client()
+        for _ in range(args.logins):
+            inicio = time.perf_counter()
+            resposta = cliente.post('/login', data={'email': 'atual@exemplo.com', 'senha': 'senha'})
+            duracao = time.perf_counter() - inicio
+            with lock:
+                if resposta.headers.get('Location', '').endswith('/login'):
+                    recusados[0] += 1
+                else:
+                    latencias.append(duracao)
+            cliente.get('/logout')
+
+    def pagina_barata():
+        cliente = app.test_client()
+        while not fim.is_set():
+            inicio = time.perf_counter()
+            cliente.get('/esqueci_senha')
+            paginas.append(time.perf_counter() - inicio)
+
+    barata = threading.Thread(target=pagina_barata)
+    barata.start()
+    threads = [threading.Thread(target=logar) for _ in range(args.threads)]
+    inicio = time.perf_counter()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    duracao = time.perf_counter() - inicio
+    fim.set()
+    barata.join()
+
+    print(f"{args.threads} threads x {args.logins} logins em {duracao:.2f}s: "
+          f"p50={percentil(latencias, 0.5) * 1000:.1f} ms p99={percentil(latencias, 0.99) * 1000:.1f} ms, "
+          f"recusados={recusados[0]}")
+    print(f"Página barata durante a rajada: p50={percentil(paginas, 0.5) * 1000:.1f} ms "
+          f"p99={percentil(paginas, 0.99) * 1000:.1f} ms ({len(paginas)} requisições)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,156 @@
+"""Processamento das fotos enviadas (animais e perfis).
+
+Só depende do Pillow, sem Flask nem banco, para poder rodar nos processos
+do pool de imagens criado em app.py.
+"""
+import os
+import time
+
+from PIL import ExifTags, Image, ImageOps
+
+TAMANHO_FOTO = (400, 400)
+
+# Limites por foto, conferidos antes de decodificar: dimensões declaradas no cabeçalho
+# (bombas de descompressão) e memória da imagem decodificada (já reduzida pelo draft).
+PIXELS_MAX = int(os.environ.get('IMAGENS_PIXELS_MAX', 50_000_000))
+MEMORIA_MAX = int(os.environ.get('IMAGENS_MEMORIA_MAX_MB', 128)) * 1024 * 1024
+# Maior foto aceita em qualquer formato (JPEG maiores passam se o draft couber em MEMORIA_MAX);
+# RGB, RGBA, I e F ocupam 4 bytes por pixel no Pillow
+MEGAPIXELS_MAX = min(PIXELS_MAX, MEMORIA_MAX // 4) // 1_000_000
+
+# Versões geradas para cada foto de animal: (nome, largura em px, recorte quadrado).
+# As quadradas preenchem a caixa de 200x200 da grade (1x e 2x); as outras mantêm a
+# proporção e servem o modal de detalhe. Cada uma sai em WebP e em JPEG.
+VARIANTES_FOTO = (
+    ('miniatura', 240, True),
+    ('card', 480, True),
+    ('media', 720, False),
+    ('detalhe', 1200, False),
+)
+FORMATOS_VARIANTE = (('webp', 'WEBP', {'quality': 80, 'method': 4}),
+                     ('jpg', 'JPEG', {'quality': 85, 'optimize': True, 'progressive': True}))
+# Tamanho com que gerar_variantes lê a foto: a maior largura proporcional e o lado do maior recorte quadrado
+TAMANHO_VARIANTES = (max(largura for _, largura, quadrada in VARIANTES_FOTO if not quadrada),
+                     max(largura for _, largura, quadrada in VARIANTES_FOTO if quadrada))
+
+
+def nome_variante(base, largura, extensao):
+    return f"{base}-{largura}.{extensao}"
+
+
+def conferir_dimensoes(imagem, tamanho):
+    """Recusa (DecompressionBombError) o que abrir_foto(…, tamanho) recusaria; só lê o cabeçalho.
+
+    Passa de PIXELS_MAX pelas dimensões declaradas ou de MEMORIA_MAX depois de decodificada;
+    no JPEG já aplica o draft para perto de `tamanho` (girado conforme o EXIF).
+    """
+    largura, altura = imagem.size
+    if largura * altura > PIXELS_MAX:
+        raise Image.DecompressionBombError(f"imagem de {largura}x{altura} px passa do limite de {PIXELS_MAX} px")
+    if imagem.getexif().get(ExifTags.Base.Orientation, 1) in (5, 6, 7, 8):
+        tamanho = tamanho[::-1]  # girada 90°: a largura final é a altura gravada
+    if imagem.format == 'JPEG':
+        imagem.draft(None, tamanho)
+    largura, altura = imagem.size
+    if largura * altura * 4 > MEMORIA_MAX:
+        raise Image.DecompressionBombError(
+            f"imagem de {largura}x{altura} px passa do limite de {MEMORIA_MAX // 2 ** 20} MB")
+    return tamanho
+
+
+def abrir_foto(origem, tamanho):
+    """Decodifica `origem` já perto de `tamanho` (largura, altura mínimas depois de girada).
+
+    JPEG usa o draft (a libjpeg decodifica direto em 1/2, 1/4 ou 1/8 da resolução); os outros
+    formatos são decodificados inteiros e reduzidos por média de blocos, mantendo o dobro do
+    tamanho para o LANCZOS. Aplica a orientação do EXIF e devolve a imagem sem metadados
+    (só o perfil de cor fica).
+    """
+    with Image.open(origem) as imagem:
+        tamanho = conferir_dimensoes(imagem, tamanho)
+        largura, altura = imagem.size
+        imagem.load()
+        fator = min(largura // (2 * tamanho[0]), altura // (2 * tamanho[1]))
+        if fator >= 2:
+            imagem = imagem.reduce(fator)
+        ImageOps.exif_transpose(imagem, in_place=True)
+    perfil_cor = imagem.info.get('icc_profile')
+    imagem.info = {'icc_profile': perfil_cor} if perfil_cor else {}
+    return imagem
+
+
+def _salvar(imagem, destino, formato, **opcoes):
+    """Grava sem EXIF/XMP/comentários; o perfil de cor é o único metadado mantido."""
+    perfil_cor = imagem.info.get('icc_profile')
+    if perfil_cor:
+        opcoes['icc_profile'] = perfil_cor
+    imagem.save(destino, format=formato, **opcoes)
+
+
+def _para_rgb(imagem):
+    """Remove transparência sobre fundo branco (o JPEG não tem canal alfa)."""
+    if imagem.mode in ("RGBA", "LA") or (imagem.mode == "P" and "transparency" in imagem.info):
+        imagem = imagem.convert("RGBA")
+        fundo = Image.new("RGB", imagem.size, (255, 255, 255))
+        fundo.paste(imagem, mask=imagem.getchannel("A"))
+        return fundo
+    if imagem.mode != "RGB":
+        return imagem.convert("RGB")
+    return imagem
+
+
+def _redimensionar(imagem, largura, quadrada):
+    if quadrada:
+        # Recorte central: mesmo enquadramento do object-fit: cover da grade, sem distorcer
+        return ImageOps.fit(imagem, (largura, largura), Image.Resampling.LANCZOS)
+    if imagem.width <= largura:
+        return imagem
+    altura = max(1, round(imagem.height * largura / imagem.width))
+    return imagem.resize((largura, altura), Image.Resampling.LANCZOS)
+
+
+def gerar_variantes(origem, pasta_destino, base):
+    """Gera as versões de VARIANTES_FOTO (WebP + JPEG) sem distorcer a foto e apaga a origem.
+
+    Retorna (inicio, duracao) em segundos, como processar_foto.
+    """
+    inicio = time.time()
+    relogio = time.perf_counter()
+    try:
+        imagem = _para_rgb(abrir_foto(origem, TAMANHO_VARIANTES))
+        os.makedirs(os.path.dirname(os.path.join(pasta_destino, base)), exist_ok=True)
+        for _, largura, quadrada in VARIANTES_FOTO:
+            variante = _redimensionar(imagem, largura, quadrada)
+            for extensao, formato, opcoes in FORMATOS_VARIANTE:
+                destino = os.path.join(pasta_destino, nome_variante(base, largura, extensao))
+                temporario = f"{destino}.{os.getpid()}.tmp"
+                _salvar(variante, temporario, formato, **opcoes)
+                os.replace(temporario, destino)
+    finally:
+        if os.path.exists(origem):
+            os.remove(origem)
+    return inicio, time.perf_counter() - relogio
+
+
+def processar_foto(origem, destino, formato, tamanho=TAMANHO_FOTO):
+    """Converte e redimensiona `origem` em `destino` e apaga o arquivo original.
+
+    Retorna (inicio, duracao) em segundos, para a fila medir espera e processamento.
+    """
+    inicio = time.time()
+    relogio = time.perf_counter()
+    temporario = f"{destino}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(destino), exist_ok=True)
+        imagem = abrir_foto(origem, tamanho)
+        if imagem.mode in ("RGBA", "P"):
+            imagem = imagem.convert("RGB")
+        imagem = imagem.resize(tamanho, Image.Resampling.LANCZOS)
+        _salvar(imagem, temporario, formato)
+        os.replace(temporario, destino)
+    finally:
+        if os.path.exists(temporario):
+            os.remove(temporario)
+        if os.path.exists(origem):
+            os.remove(origem)
+    return inicio, time.perf_counter() - relogio
@@ -0,0 +1,13 @@
+-- ===============================
+-- Índices da tabela animais
+-- ===============================
+-- Alternativa em SQL ao comando `flask criar-indices` para bancos MySQL
+-- criados antes dos índices existirem no modelo.
+
+CREATE INDEX ix_animais_ativo_criado ON animais (ativo, criado_em, id);
+CREATE INDEX ix_animais_ativo_estado_criado ON animais (ativo, estado, criado_em, id);
+CREATE INDEX ix_animais_ativo_estado_cidade_criado ON animais (ativo, estado, cidade, criado_em, id);
+CREATE INDEX ix_animais_ativo_especie_raca_criado ON animais (ativo, especie, raca, criado_em, id);
+CREATE INDEX ix_animais_ativo_sexo_criado ON animais (ativo, sexo, criado_em, id);
+CREATE INDEX ix_animais_usuario_criado ON animais (usuario_id, criado_em, id);
+CREATE INDEX ix_animais_ativo_validade ON animais (ativo, data_validade);
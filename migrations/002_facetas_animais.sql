@@ -0,0 +1,11 @@
+-- ===============================
+-- Contagens dos filtros da listagem
+-- ===============================
+-- Depois de criar a tabela, preencha-a com `flask --app app recalcular-facetas`.
+
+CREATE TABLE animais_facetas (
+    dimensao VARCHAR(20) NOT NULL,
+    valor VARCHAR(160) NOT NULL,
+    total INT NOT NULL DEFAULT 0,
+    PRIMARY KEY (dimensao, valor)
+);
@@ -0,0 +1,5 @@
+-- ===============================
+-- Fotos de animais aguardando o pool de imagens
+-- ===============================
+
+ALTER TABLE animais ADD COLUMN foto_pendente VARCHAR(200) NULL;
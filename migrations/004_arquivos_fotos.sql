@@ -0,0 +1,13 @@
+-- ===============================
+-- Fotos gravadas pelo hash do conteúdo
+-- ===============================
+-- Depois de criar a tabela, regrave as fotos antigas com `flask --app app migrar-fotos`
+-- (use --remover-antigos para apagar os arquivos com o nome original).
+
+CREATE TABLE arquivos_fotos (
+    tipo VARCHAR(10) NOT NULL,
+    caminho VARCHAR(200) NOT NULL,
+    referencias INT NOT NULL DEFAULT 0,
+    criado_em DATETIME NULL,
+    PRIMARY KEY (tipo, caminho)
+);
@@ -0,0 +1,17 @@
+-- ===============================
+-- Caixa de saída de e-mails
+-- ===============================
+
+CREATE TABLE emails_pendentes (
+    id INT AUTO_INCREMENT PRIMARY KEY,
+    destinatario VARCHAR(120) NOT NULL,
+    assunto VARCHAR(200) NOT NULL,
+    html TEXT NOT NULL,
+    criado_em DATETIME NULL,
+    proxima_tentativa DATETIME NULL,
+    tentativas INT NOT NULL DEFAULT 0,
+    enviado_em DATETIME NULL,
+    ultimo_erro VARCHAR(500) NULL
+);
+
+CREATE INDEX ix_emails_pendentes_envio ON emails_pendentes (enviado_em, proxima_tentativa);
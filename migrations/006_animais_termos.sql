@@ -0,0 +1,13 @@
+-- ===============================
+-- Índice invertido da busca textual
+-- ===============================
+-- Depois de criar a tabela, preencha-a com `flask --app app reindexar-busca`.
+
+CREATE TABLE animais_termos (
+    termo VARCHAR(60) NOT NULL,
+    animal_id INT NOT NULL,
+    peso INT NOT NULL,
+    PRIMARY KEY (termo, animal_id)
+);
+
+CREATE INDEX ix_animais_termos_animal_id ON animais_termos (animal_id);
@@ -0,0 +1,11 @@
+-- ===============================
+-- Coordenadas dos anúncios (filtro por distância)
+-- ===============================
+-- Depois de importar as coordenadas das cidades (`flask --app app importar-coordenadas municipios.csv`),
+-- preencha as colunas com `flask --app app atualizar-coordenadas`.
+
+ALTER TABLE animais ADD COLUMN latitude FLOAT NULL;
+ALTER TABLE animais ADD COLUMN longitude FLOAT NULL;
+ALTER TABLE animais ADD COLUMN geohash VARCHAR(6) NULL;
+
+CREATE INDEX ix_animais_ativo_geohash ON animais (ativo, geohash, latitude, longitude);
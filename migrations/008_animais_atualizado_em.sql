@@ -0,0 +1,7 @@
+-- ===============================
+-- Data da última alteração de cada anúncio (ETag da API /api/animais)
+-- ===============================
+
+ALTER TABLE animais ADD COLUMN atualizado_em DATETIME NULL;
+
+UPDATE animais SET atualizado_em = criado_em WHERE atualizado_em IS NULL;
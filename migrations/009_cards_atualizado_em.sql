@@ -0,0 +1,10 @@
+-- ===============================
+-- Versão dos cards em cache: data da última alteração do anúncio e do doador
+-- ===============================
+
+-- Microssegundos para duas alterações no mesmo segundo gerarem versões diferentes
+ALTER TABLE animais MODIFY atualizado_em DATETIME(6) NULL;
+
+ALTER TABLE usuarios ADD COLUMN atualizado_em DATETIME(6) NULL;
+
+UPDATE usuarios SET atualizado_em = NOW(6) WHERE atualizado_em IS NULL;
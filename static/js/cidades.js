@@ -0,0 +1,37 @@
+// Busca as cidades de um estado na API, guardando cada estado já buscado
+// para não repetir a requisição na mesma página.
+const _cidadesPorEstado = {};
+
+function buscarCidades(uf) {
+    if (!uf) return Promise.resolve([]);
+    if (!_cidadesPorEstado[uf]) {
+        const url = API_CIDADES_URL.replace('__UF__', encodeURIComponent(uf));
+        _cidadesPorEstado[uf] = fetch(url)
+            .then(resposta => resposta.ok ? resposta.json() : { cidades: [] })
+            .then(dados => dados.cidades || [])
+            .catch(() => {
+                delete _cidadesPorEstado[uf];
+                return [];
+            });
+    }
+    return _cidadesPorEstado[uf];
+}
+
+// Preenche um <select> de cidades com as cidades do estado informado
+function preencherSelectCidades(select, uf, cidadeSelecionada, textoPadrao) {
+    return buscarCidades(uf).then(cidades => {
+        select.innerHTML = '';
+        const padrao = document.createElement('option');
+        padrao.value = '';
+        padrao.text = textoPadrao || 'Selecione uma cidade';
+        select.appendChild(padrao);
+        cidades.forEach(function(cidade) {
+            const option = document.createElement('option');
+            option.value = cidade;
+            option.text = cidade;
+            if (cidade === cidadeSelecionada) option.selected = true;
+            select.appendChild(option);
+        });
+        return cidades;
+    });
+}
@@ -0,0 +1,26 @@
+"""Configuração comum: SQLite temporário e app importado uma vez só para todos os módulos."""
+import os
+import sys
+import tempfile
+
+RAIZ = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, RAIZ)
+os.environ['DATABASE_URL'] = f"sqlite:///{os.path.join(tempfile.mkdtemp(prefix='adoteja-testes-'), 'testes.db')}"
+os.environ['DATABASE_REPLICA_URL'] = ''
+os.environ['EMAIL_EM_PROCESSO'] = '0'
+os.environ['SENHA_METODO'] = 'pbkdf2:sha256:1000'
+
+import pytest  # noqa: E402
+
+import app as adoteja  # noqa: E402
+from app import app, db  # noqa: E402
+
+
+@pytest.fixture(scope='module')
+def banco():
+    """Tabelas recriadas para cada módulo, sem usuários em cache de um módulo anterior."""
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+    adoteja.cache_usuarios = adoteja.CacheTTL(app.config['USUARIO_CACHE_MAX'], app.config['USUARIO_CACHE_TTL'])
+    return db
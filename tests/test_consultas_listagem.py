@@ -0,0 +1,51 @@
+"""A listagem faz o mesmo número de comandos SQL para qualquer quantidade de cards (sem N+1)."""
+import pytest
+from sqlalchemy import event
+
+import app as adoteja
+from app import app, db, Animal, Usuario
+
+TAMANHOS = [1, 5, 30]
+
+
+@pytest.fixture(scope='module')
+def cliente(banco):
+    with app.app_context():
+        for i in range(max(TAMANHOS) + 1):
+            db.session.add(Usuario(nome=f'Doador {i}', email=f'doador{i}@exemplo.com',
+                                   senha=adoteja.gerar_hash_senha('senha'), telefone='(43) 99999-0000',
+                                   estado='PR', cidade='Londrina', email_confirmado=True))
+        db.session.flush()
+        # Cada anúncio de um doador diferente: um SELECT por doador apareceria na contagem
+        for i in range(max(TAMANHOS)):
+            db.session.add(Animal(usuario_id=i + 2, nome=f'Pet {i}', especie='Cachorro', raca='SRD Porte Médio',
+                                  sexo='Macho', estado='PR', cidade='Londrina'))
+        db.session.commit()
+    cliente = app.test_client()
+    cliente.post('/login', data={'email': 'doador0@exemplo.com', 'senha': 'senha'})
+    return cliente
+
+
+def comandos_por_pagina(cliente, tamanho):
+    comandos = []
+
+    def contar(conexao, cursor, comando, *args):
+        comandos.append(comando)
+
+    with app.app_context():
+        engine = db.engine
+    event.listen(engine, 'before_cursor_execute', contar)
+    try:
+        resposta = cliente.get(f'/listar_animais?por_pagina={tamanho}')
+    finally:
+        event.remove(engine, 'before_cursor_execute', contar)
+    assert resposta.status_code == 200
+    assert resposta.get_data(as_text=True).count('Pet ') >= tamanho
+    return len(comandos)
+
+
+def test_comandos_nao_crescem_com_os_cards(cliente, monkeypatch):
+    monkeypatch.setitem(app.config, 'ANIMAIS_POR_PAGINA_MAX', max(TAMANHOS))
+    cliente.get('/listar_animais')  # aquece caches (usuário logado, facetas) antes de contar
+    contagens = {tamanho: comandos_por_pagina(cliente, tamanho) for tamanho in TAMANHOS}
+    assert len(set(contagens.values())) == 1, contagens
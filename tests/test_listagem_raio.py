@@ -0,0 +1,48 @@
+"""Filtro de distância da listagem (/listar_animais?raio=N) com as coordenadas de data/cidades/."""
+import pytest
+
+import app as adoteja
+from app import app, db, Animal, Usuario
+
+# Distâncias aproximadas de Londrina (km)
+CIDADES = [('Curitiba', 380), ('Maringá', 80), ('Cambé', 13), ('Londrina', 0), ('Apucarana', 40), ('Rolândia', 20)]
+
+
+@pytest.fixture(scope='module')
+def cliente(banco):
+    with app.app_context():
+        db.session.add(Usuario(nome='Ana', email='ana@exemplo.com', senha=adoteja.gerar_hash_senha('senha'),
+                               estado='PR', cidade='Londrina', email_confirmado=True))
+        db.session.flush()
+        for cidade, _ in CIDADES:
+            db.session.add(Animal(usuario_id=1, nome=f'Pet de {cidade}', especie='Cachorro', sexo='Macho',
+                                  estado='PR', cidade=cidade))
+        db.session.commit()
+    cliente = app.test_client()
+    cliente.post('/login', data={'email': 'ana@exemplo.com', 'senha': 'senha'})
+    return cliente
+
+
+def nomes_na_pagina(html):
+    posicoes = {cidade: html.find(f'Pet de {cidade}') for cidade, _ in CIDADES}
+    return [cidade for cidade, posicao in sorted(posicoes.items(), key=lambda item: item[1]) if posicao >= 0]
+
+
+def test_catalogo_tem_coordenadas():
+    assert adoteja.catalogo_geo().coordenadas[('PR', 'Londrina')]
+
+
+def test_raio_ordena_pela_distancia(cliente):
+    resposta = cliente.get('/listar_animais?estado=PR&cidade=Londrina&raio=100')
+    assert resposta.status_code == 200
+    assert nomes_na_pagina(resposta.get_data(as_text=True)) == [
+        'Londrina', 'Cambé', 'Rolândia', 'Apucarana', 'Maringá']
+
+
+def test_raio_pequeno_exclui_cidades_distantes(cliente):
+    resposta = cliente.get('/listar_animais?estado=PR&cidade=Londrina&raio=25')
+    assert nomes_na_pagina(resposta.get_data(as_text=True)) == ['Londrina', 'Cambé', 'Rolândia']
+
+
+def test_filtro_de_distancia_aparece(cliente):
+    assert 'name="raio"' in cliente.get('/listar_animais').get_data(as_text=True)